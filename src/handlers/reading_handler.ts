@@ -4,6 +4,10 @@ import { Logger } from '../utils/logger.ts';
 
 const logger = new Logger('[Reading]');
 
+// Patterns used on every page read, compiled once at module load
+const PAGE_MARKER_REGEX = /\[PAGE:(\d+)\]/g;
+const SENTENCE_REGEX = /[^.!?]+[.!?]+/g;
+
 /**
  * Enhanced Reading Manager with Supabase integration and better user experience
  *
@@ -25,7 +29,7 @@ export async function ReadingManager(
     readingMode?: 'paragraphs' | 'sentences' | 'fullpage' | null,
     readingAmount?: number | null,
 ): Promise<{ success: boolean; data?: any; message: string }> {
-    logger.info(`ReadingManager called: mode=${mode}, action=${action}, userId=${userId}`);
+    logger.debug(`ReadingManager called: mode=${mode}, action=${action}, userId=${userId}`);
 
     try {
         switch (mode) {
@@ -273,22 +277,28 @@ async function handleContinueMode(
         };
     }
 
-    // Generate recap of previous pages
-    const recap = await generateRecap(supabase, book, history.current_page);
+    // Download the book alongside the reading settings
+    const [bookFile, { data: settings }] = await Promise.all([
+        loadBookPages(supabase, book.file_path),
+        supabase
+            .from('reading_settings')
+            .select('*')
+            .eq('user_id', userId)
+            .single(),
+    ]);
+
+    if (!bookFile.success) {
+        return bookFile;
+    }
 
-    // Read current page
-    const pageContent = await readPageFromStorage(supabase, book.file_path, history.current_page);
+    // Read current page and recap previous pages from the same downloaded book
+    const pageContent = getPageContent(bookFile.data.pages, history.current_page);
 
     if (!pageContent.success) {
         return pageContent;
     }
 
-    // Get reading settings
-    const { data: settings } = await supabase
-        .from('reading_settings')
-        .select('*')
-        .eq('user_id', userId)
-        .single();
+    const recap = generateRecap(bookFile.data.pages, history.current_page);
 
     const readingMode = settings?.reading_mode || 'fullpage';
     const readingAmount = settings?.reading_amount || 1;
@@ -336,46 +346,44 @@ async function handleContinueMode(
 /**
  * Generate a recap of previous pages
  */
-async function generateRecap(
-    supabase: SupabaseClient,
-    book: any,
-    currentPage: number,
-): Promise<string | null> {
+function generateRecap(pages: string[], currentPage: number): string | null {
     if (currentPage <= 1) return null;
 
-    try {
-        // Read previous 1-2 pages for context
-        const pagesToRecap = Math.min(2, currentPage - 1);
-        let recapContent = '';
-
-        for (let i = currentPage - pagesToRecap; i < currentPage; i++) {
-            const pageResult = await readPageFromStorage(supabase, book.file_path, i);
-            if (pageResult.success) {
-                recapContent += pageResult.data.content + ' ';
-            }
-        }
+    // Use the previous 1-2 pages for context
+    const pagesToRecap = Math.min(2, currentPage - 1);
 
-        if (!recapContent) return null;
+    // Simple summarization: Take first few sentences
+    // In production, you might want to use an AI service for better summarization
+    // Pages are scanned one at a time, carrying an unfinished sentence over to the next
+    // page, and scanning stops as soon as enough sentences are collected.
+    const sentences: string[] = [];
+    let carry = '';
 
-        // Simple summarization: Take first few sentences
-        // In production, you might want to use an AI service for better summarization
-        const sentences = recapContent.match(/[^.!?]+[.!?]+/g) || [];
-        const summary = sentences.slice(0, 3).join(' ').trim();
+    for (const page of pages.slice(currentPage - 1 - pagesToRecap, currentPage - 1)) {
+        const text = carry + page + ' ';
+        let consumed = 0;
 
-        return summary || null;
-    } catch (err) {
-        logger.error('Error generating recap:', err);
-        return null;
+        for (const match of sentenceScanRange(text).matchAll(SENTENCE_REGEX)) {
+            sentences.push(match[0]);
+            consumed = match.index! + match[0].length;
+            if (sentences.length === 3) break;
+        }
+
+        if (sentences.length === 3) break;
+        carry = text.slice(consumed);
     }
+
+    const summary = sentences.join(' ').trim();
+
+    return summary || null;
 }
 
 /**
- * Read page content from Supabase storage
+ * Download a book file from Supabase storage and split it into pages
  */
-async function readPageFromStorage(
+async function loadBookPages(
     supabase: SupabaseClient,
     filePath: string,
-    pageNumber: number,
 ): Promise<{ success: boolean; data?: any; message: string }> {
     try {
         // Download the book file from storage
@@ -394,20 +402,10 @@ async function readPageFromStorage(
         // Parse pages (assuming books are formatted with page markers or double line breaks)
         const pages = parseBookIntoPages(text);
 
-        if (pageNumber > pages.length || pageNumber < 1) {
-            return {
-                success: false,
-                message: `Page ${pageNumber} not found. Book has ${pages.length} pages.`,
-            };
-        }
-
         return {
             success: true,
-            data: {
-                content: pages[pageNumber - 1],
-                totalPages: pages.length,
-            },
-            message: `Successfully read page ${pageNumber} of ${pages.length}`,
+            data: { pages },
+            message: `Loaded ${pages.length} pages`,
         };
     } catch (err) {
         logger.error('Error reading from storage:', err);
@@ -415,25 +413,94 @@ async function readPageFromStorage(
     }
 }
 
+/**
+ * Get a single page from an already loaded book
+ */
+function getPageContent(
+    pages: string[],
+    pageNumber: number,
+): { success: boolean; data?: any; message: string } {
+    if (pageNumber > pages.length || pageNumber < 1) {
+        return {
+            success: false,
+            message: `Page ${pageNumber} not found. Book has ${pages.length} pages.`,
+        };
+    }
+
+    return {
+        success: true,
+        data: {
+            content: pages[pageNumber - 1],
+            totalPages: pages.length,
+        },
+        message: `Successfully read page ${pageNumber} of ${pages.length}`,
+    };
+}
+
+/**
+ * Read page content from Supabase storage
+ */
+async function readPageFromStorage(
+    supabase: SupabaseClient,
+    filePath: string,
+    pageNumber: number,
+): Promise<{ success: boolean; data?: any; message: string }> {
+    const bookFile = await loadBookPages(supabase, filePath);
+
+    if (!bookFile.success) {
+        return bookFile;
+    }
+
+    return getPageContent(bookFile.data.pages, pageNumber);
+}
+
 /**
  * Parse book text into pages
  */
 function parseBookIntoPages(text: string): string[] {
-    // Check for page markers first
-    if (text.includes('[PAGE:')) {
-        const pages: string[] = [];
-        const pageRegex = /\[PAGE:(\d+)\]([\s\S]*?)(?=\[PAGE:\d+\]|$)/g;
-        let match;
-
-        while ((match = pageRegex.exec(text)) !== null) {
-            pages[parseInt(match[1]) - 1] = match[2].trim();
+    const pages: string[] = [];
+    let pageIndex = -1;
+    let cursor = 0;
+
+    // Walk the markers once; each page is the text between its marker and the next one
+    for (const match of text.matchAll(PAGE_MARKER_REGEX)) {
+        if (pageIndex >= 0) pages[pageIndex] = text.slice(cursor, match.index).trim();
+        pageIndex = parseInt(match[1]) - 1;
+        cursor = match.index! + match[0].length;
+    }
+
+    // Every match moves the cursor past its marker, so a zero cursor means the book has
+    // no page markers; fall back to double line break separation
+    if (cursor === 0) {
+        return splitOnBlankLines(text);
+    }
+
+    if (pageIndex >= 0) pages[pageIndex] = text.slice(cursor).trim();
+
+    return pages.filter((p) => p); // Remove empty pages
+}
+
+/**
+ * Split text into blocks separated by one or more blank lines in a single line scan
+ */
+function splitOnBlankLines(text: string): string[] {
+    const blocks: string[] = [];
+    let current: string[] = [];
+
+    for (const line of text.split('\n')) {
+        if (line.trim()) {
+            current.push(line);
+        } else if (current.length > 0) {
+            blocks.push(current.join('\n'));
+            current = [];
         }
+    }
 
-        return pages.filter((p) => p); // Remove empty pages
+    if (current.length > 0) {
+        blocks.push(current.join('\n'));
     }
 
-    // Fallback to double line break separation
-    return text.split(/\n\s*\n/).filter((page) => page.trim().length > 0);
+    return blocks;
 }
 
 /**
@@ -444,14 +511,28 @@ function applyReadingMode(
     mode: string,
     amount: number,
 ): string {
+    // Whole number of paragraphs/sentences, matching how slice() treated the stored amount
+    const limit = Math.trunc(amount);
+
     switch (mode) {
-        case 'paragraphs':
-            const paragraphs = content.split('\n').filter((p) => p.trim());
-            return paragraphs.slice(0, amount).join('\n\n');
+        case 'paragraphs': {
+            // Scan line by line and stop once enough non-blank paragraphs are collected
+            const paragraphs: string[] = [];
+            let start = 0;
+
+            while (paragraphs.length < limit) {
+                const end = content.indexOf('\n', start);
+                const line = content.slice(start, end === -1 ? content.length : end);
+                if (line.trim()) paragraphs.push(line);
+                if (end === -1) break;
+                start = end + 1;
+            }
+
+            return paragraphs.join('\n\n');
+        }
 
         case 'sentences':
-            const sentences = content.match(/[^.!?]+[.!?]+/g) || [];
-            return sentences.slice(0, amount).join(' ');
+            return takeSentences(content, limit).join(' ');
 
         case 'fullpage':
         default:
@@ -459,6 +540,31 @@ function applyReadingMode(
     }
 }
 
+/**
+ * Take the first few sentences of the text without matching the rest of it
+ */
+function takeSentences(text: string, limit: number): string[] {
+    const sentences: string[] = [];
+    if (limit < 1) return sentences;
+
+    for (const match of sentenceScanRange(text).matchAll(SENTENCE_REGEX)) {
+        sentences.push(match[0]);
+        if (sentences.length >= limit) break;
+    }
+
+    return sentences;
+}
+
+/**
+ * Cut the text just after its last sentence terminator. Nothing past it can form a sentence,
+ * and leaving it out keeps the sentence regex linear: with no terminator ahead it would
+ * otherwise backtrack over the whole remaining text from every start position.
+ */
+function sentenceScanRange(text: string): string {
+    const end = Math.max(text.lastIndexOf('.'), text.lastIndexOf('!'), text.lastIndexOf('?'));
+    return text.slice(0, end + 1);
+}
+
 /**
  * Search for books
  */
@@ -559,7 +665,10 @@ async function handleNavigateMode(
             targetPage = Math.max(targetPage - 1, 1);
             break;
         case 'goto':
-            if (pageNumber && pageNumber >= 1 && pageNumber <= book.total_pages) {
+            if (
+                pageNumber && Number.isInteger(pageNumber) && pageNumber >= 1 &&
+                pageNumber <= book.total_pages
+            ) {
                 targetPage = pageNumber;
             } else {
                 return {
@@ -579,8 +688,23 @@ async function handleNavigateMode(
             };
     }
 
-    // Read the target page
-    const pageContent = await readPageFromStorage(supabase, book.file_path, targetPage);
+    // 'next' clamps to 0 when the book has no pages; reject that before downloading the file
+    if (targetPage < 1) {
+        return {
+            success: false,
+            message: `Invalid page number. Book has ${book.total_pages} pages.`,
+        };
+    }
+
+    // Read the target page alongside the reading settings
+    const [pageContent, { data: settings }] = await Promise.all([
+        readPageFromStorage(supabase, book.file_path, targetPage),
+        supabase
+            .from('reading_settings')
+            .select('*')
+            .eq('user_id', userId)
+            .single(),
+    ]);
 
     if (!pageContent.success) {
         return pageContent;
@@ -599,13 +723,7 @@ async function handleNavigateMode(
             onConflict: 'user_id,book_name',
         });
 
-    // Get reading settings and apply
-    const { data: settings } = await supabase
-        .from('reading_settings')
-        .select('*')
-        .eq('user_id', userId)
-        .single();
-
+    // Apply reading settings
     const processedContent = applyReadingMode(
         pageContent.data.content,
         settings?.reading_mode || 'fullpage',
@@ -670,6 +788,16 @@ async function handleSettingsMode(
             };
         }
 
+        if (
+            readingMode !== 'fullpage' && readingAmount &&
+            (!Number.isInteger(readingAmount) || readingAmount < 1)
+        ) {
+            return {
+                success: false,
+                message: 'Invalid reading amount. Choose a whole number of 1 or more.',
+            };
+        }
+
         const amount = readingMode === 'fullpage' ? 1 : (readingAmount || 1);
 
         const { error } = await supabase